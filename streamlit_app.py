@@ -1,11 +1,110 @@
 import streamlit as st
 import pandas as pd
+import os
 import sqlite3
-import plotly.express as px
+from itertools import islice
 
-# Database connection
-conn = sqlite3.connect("food_wastage.db")
-cursor = conn.cursor()
+DB_PATH = "food_wastage.db"
+
+DATA_FILES = {
+    "providers": "providers_data.csv",
+    "receivers": "receivers_data.csv",
+    "food_listings": "food_listings_data.csv",
+    "claims": "claims_data.csv",
+}
+
+
+def load_frames() -> dict[str, pd.DataFrame]:
+    frames = {}
+    for table, csv_path in DATA_FILES.items():
+        # Prefer the Parquet sidecar (generated here, not tracked) unless the
+        # CSV is newer; otherwise read the CSV and refresh the sidecar if we can
+        parquet_path = csv_path.replace(".csv", ".parquet")
+        if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+            df = pd.read_parquet(parquet_path)
+        else:
+            df = pd.read_csv(csv_path)
+            # Write to a temp file and swap it in, so a cut-off write never
+            # leaves a truncated sidecar that looks newer than the CSV
+            tmp_path = parquet_path + ".tmp"
+            try:
+                df.to_parquet(tmp_path, index=False)
+                os.replace(tmp_path, parquet_path)
+            except OSError:
+                # read-only deploy: the sidecar is only an optimisation
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        frames[table] = df
+    return frames
+
+
+def sql_type(dtype) -> str:
+    if pd.api.types.is_integer_dtype(dtype):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(dtype):
+        return "REAL"
+    return "TEXT"
+
+
+# Explicit DDL + batched executemany in one transaction, instead of to_sql
+def bulk_load(conn, table, df, batch_size=10_000):
+    columns = ", ".join(f'"{col}" {sql_type(dtype)}' for col, dtype in df.dtypes.items())
+    placeholders = ", ".join("?" * len(df.columns))
+    rows = df.itertuples(index=False, name=None)
+    with conn:
+        # Explicit BEGIN so the DDL rolls back with the rows on failure
+        conn.execute("BEGIN")
+        conn.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({columns})')
+        while batch := list(islice(rows, batch_size)):
+            conn.executemany(f'INSERT INTO "{table}" VALUES ({placeholders})', batch)
+
+
+# Database connection (shared across sessions and reruns). Tables are
+# loaded once, only when missing, so CRUD edits survive reruns.
+@st.cache_resource(show_spinner=False)
+def get_conn():
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA cache_size=-200000;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+    """)
+    conn.row_factory = sqlite3.Row
+
+    # A table present in sqlite_master is fully loaded: bulk_load creates and
+    # fills it in one transaction, so a failed load leaves no table behind
+    existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    missing = [table for table in DATA_FILES if table not in existing]
+    if missing:
+        frames = load_frames()
+        for table in missing:
+            bulk_load(conn, table, frames[table])
+
+    # Indexes on the join / filter keys used by the queries below
+    conn.executescript("""
+        CREATE INDEX IF NOT EXISTS idx_claims_food ON claims(Food_ID);
+        CREATE INDEX IF NOT EXISTS idx_claims_recv ON claims(Receiver_ID);
+        CREATE INDEX IF NOT EXISTS idx_claims_status ON claims(Status);
+        CREATE INDEX IF NOT EXISTS idx_fl_prov ON food_listings(Provider_ID);
+        CREATE INDEX IF NOT EXISTS idx_fl_food ON food_listings(Food_ID);
+        CREATE INDEX IF NOT EXISTS idx_fl_ftype ON food_listings(Food_Type);
+        CREATE INDEX IF NOT EXISTS idx_fl_mtype ON food_listings(Meal_Type);
+        CREATE INDEX IF NOT EXISTS idx_prov_id ON providers(Provider_ID);
+        CREATE INDEX IF NOT EXISTS idx_prov_city ON providers(City);
+        CREATE INDEX IF NOT EXISTS idx_prov_name ON providers(Name);
+        CREATE INDEX IF NOT EXISTS idx_recv_id ON receivers(Receiver_ID);
+        CREATE INDEX IF NOT EXISTS idx_prov_city_lower ON providers(LOWER(City));
+        ANALYZE;
+    """)
+    return conn
+
+
+# Query results are memoized per (sql, params) so reruns skip SQLite entirely
+@st.cache_data(ttl=600, show_spinner=False)
+def cached_query(sql: str, params: tuple | None = None) -> pd.DataFrame:
+    return pd.read_sql_query(sql, get_conn(), params=params)
 
 
 # Set page config (this controls layout and initial look)
@@ -39,23 +138,15 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # -------------------------------
-# Load data into SQLite tables
+# Queries
 # -------------------------------
-providers_df = pd.read_csv("providers_data.csv")
-receivers_df = pd.read_csv("receivers_data.csv")
-food_listings_df = pd.read_csv("food_listings_data.csv")
-claims_df = pd.read_csv("claims_data.csv")
-
-providers_df.to_sql("providers", conn, if_exists="replace", index=False)
-receivers_df.to_sql("receivers", conn, if_exists="replace", index=False)
-food_listings_df.to_sql("food_listings", conn, if_exists="replace", index=False)
-claims_df.to_sql("claims", conn, if_exists="replace", index=False)
+MAX_TABLE_ROWS = 500
+MAX_CHART_BARS = 50
+PAGE_SIZE = 50
 
+CITY_QUERY = "4. Contact info of food providers in a specific city"
+ALL_QUERIES = "All queries (run in order)"
 
-
-# -------------------------------
-# Queries
-# -------------------------------
 queries = {
     "1. Total Providers by City":
         """SELECT City, COUNT(*) AS provider_count
@@ -73,7 +164,7 @@ queries = {
            GROUP BY Provider_Type
            ORDER BY total_quantity DESC;""",
            
-    "4. Contact info of food providers in a specific city":
+    CITY_QUERY:
         """
         SELECT Provider_ID, Name, Address, City, Contact
         FROM providers
@@ -81,8 +172,10 @@ queries = {
         """,       
     
     "5. Receivers who claimed the most food":
-        """SELECT r.Name AS Receiver_Name,COUNT(c.Claim_ID) AS Total_Claims
-           FROM claims c
+        """SELECT r.Name AS Receiver_Name,SUM(c.claim_count) AS Total_Claims
+           FROM (SELECT Receiver_ID, COUNT(Claim_ID) AS claim_count
+                 FROM claims
+                 GROUP BY Receiver_ID) c
            JOIN receivers r
            ON c.Receiver_ID = r.Receiver_ID
            GROUP BY r.Name
@@ -108,36 +201,43 @@ queries = {
            ORDER BY total_quantity_available DESC;""",
 
     "9. Claims Count per Food Item":
-        """SELECT f.Food_Name,COUNT(c.Claim_ID) AS total_claims
-           FROM claims c
+        """SELECT f.Food_Name,SUM(c.claim_count) AS total_claims
+           FROM (SELECT Food_ID, COUNT(Claim_ID) AS claim_count
+                 FROM claims
+                 GROUP BY Food_ID) c
            JOIN food_listings f
            ON c.Food_ID = f.Food_ID
            GROUP BY f.Food_Name
            ORDER BY total_claims DESC;""",
 
     "10. Top Provider by Number of Claims":
-        """SELECT p.Name,COUNT(c.Claim_ID) AS successful_claims
-           FROM claims c
-           JOIN food_listings f
-           ON c.Food_ID = f.Food_ID
+        """SELECT p.Name,SUM(s.claim_count) AS successful_claims
+           FROM (SELECT f.Provider_ID, COUNT(c.Claim_ID) AS claim_count
+                 FROM claims c
+                 JOIN food_listings f
+                 ON c.Food_ID = f.Food_ID
+                 WHERE c.Status = 'Completed'
+                 GROUP BY f.Provider_ID) s
            JOIN providers p
-           ON f.Provider_ID = p.Provider_ID
-           WHERE c.Status = 'Completed'
+           ON s.Provider_ID = p.Provider_ID
            GROUP BY p.Name
            ORDER BY successful_claims DESC
            Limit 1;""",
 
     "11. Claims Status Percentages":
         """SELECT Status,COUNT(*) AS total_claims,
-           ROUND(COUNT(*) * 100.0 / (SELECT COUNT(*) FROM claims), 2) AS percentage
+           ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER (), 2) AS percentage
            FROM claims
            GROUP BY Status;""",
 
     "12. Average Quantity of Claimed Food per receiver":
-        """SELECT r.Name AS receiver_name,ROUND(AVG(f.Quantity), 2) AS avg_quantity_claimed
-           FROM claims c
-           JOIN food_listings f ON c.Food_ID = f.Food_ID
-           JOIN receivers r ON c.Receiver_ID = r.Receiver_ID
+        """SELECT r.Name AS receiver_name,
+           ROUND(SUM(s.total_quantity) * 1.0 / SUM(s.claim_count), 2) AS avg_quantity_claimed
+           FROM (SELECT c.Receiver_ID, SUM(f.Quantity) AS total_quantity, COUNT(f.Quantity) AS claim_count
+                 FROM claims c
+                 JOIN food_listings f ON c.Food_ID = f.Food_ID
+                 GROUP BY c.Receiver_ID) s
+           JOIN receivers r ON s.Receiver_ID = r.Receiver_ID
            GROUP BY r.Name
            ORDER BY avg_quantity_claimed DESC;""",
 
@@ -151,35 +251,97 @@ queries = {
            LIMIT 1;""",
 
     "14. Total Donated Quantity per Provider ":
-        """SELECT p.Name AS provider_name,SUM(f.Quantity) AS total_quantity_donated
-           FROM food_listings f
-           JOIN providers p 
+        """SELECT p.Name AS provider_name,SUM(f.total_quantity) AS total_quantity_donated
+           FROM (SELECT Provider_ID, SUM(Quantity) AS total_quantity
+                 FROM food_listings
+                 GROUP BY Provider_ID) f
+           JOIN providers p
            ON f.Provider_ID = p.Provider_ID
            GROUP BY p.Name
            ORDER BY total_quantity_donated DESC;""",
 
     "15. City that received the highest total quantity of claimed food":
-        """SELECT r.City AS city,SUM(f.Quantity) AS total_quantity_claimed
-           FROM claims c
-           JOIN food_listings f 
-           ON c.Food_ID = f.Food_ID
-           JOIN receivers r 
-           ON c.Receiver_ID = r.Receiver_ID
-           WHERE c.Status = 'Completed'
+        """SELECT r.City AS city,SUM(s.total_quantity) AS total_quantity_claimed
+           FROM (SELECT c.Receiver_ID, SUM(f.Quantity) AS total_quantity
+                 FROM claims c
+                 JOIN food_listings f
+                 ON c.Food_ID = f.Food_ID
+                 WHERE c.Status = 'Completed'
+                 GROUP BY c.Receiver_ID) s
+           JOIN receivers r
+           ON s.Receiver_ID = r.Receiver_ID
            GROUP BY r.City
            ORDER BY total_quantity_claimed DESC
            LIMIT 1;"""
 }
 
+
+# CRUD statements: the same SQL text each time keeps sqlite3's statement cache warm
+INSERT_PROVIDER = "INSERT INTO providers (Name, Type, Address, City, Contact) VALUES (?, ?, ?, ?, ?)"
+DELETE_PROVIDER = "DELETE FROM providers WHERE Provider_ID = ?"
+UPDATE_PROVIDER_CONTACT = "UPDATE providers SET Contact = ? WHERE Provider_ID = ?"
+
+
+# Single write transaction, then drop the cached results it invalidates
+def execute_write(sql, params):
+    conn = get_conn()
+    with conn:
+        conn.execute(sql, params)
+    cached_query.clear()
+    contact_map.clear()
+
+
+# Name -> Contact for O(1) lookups; the first row wins for repeated names
+@st.cache_data(ttl=600, show_spinner=False)
+def contact_map(table):
+    contacts = {}
+    for name, contact in get_conn().execute(f"SELECT Name, Contact FROM {table} WHERE Name IS NOT NULL"):
+        contacts.setdefault(name, contact)
+    return contacts
+
+
+# Sorted, non-null values of one column for the sidebar filters
+def distinct_values(table, column):
+    return cached_query(
+        f"SELECT DISTINCT {column} FROM {table} WHERE {column} IS NOT NULL ORDER BY {column};"
+    )[column].tolist()
+
+
+def show_df_and_chart(df, title):
+    # Top-1 and scalar results read better (and render cheaper) as a metric
+    if len(df) == 1 and df.shape[1] <= 2:
+        label = df.columns[-1] if df.shape[1] == 1 else f"{df.iat[0, 0]} ({df.columns[-1]})"
+        st.metric(label, df.iat[0, -1])
+        return
+
+    # Large results: ship a window of rows to the browser unless asked for more
+    shown = df
+    if len(df) > MAX_TABLE_ROWS and not st.toggle(f"Show all {len(df)} rows", key=f"show_all_{title}"):
+        shown = df.head(MAX_TABLE_ROWS)
+        st.caption(f"First {MAX_TABLE_ROWS} of {len(df)} rows")
+    st.dataframe(shown.style.set_properties(**{'background-color': "#8dd3fb", 'color': 'black'}))
+
+    # Show chart if possible
+    if len(df.columns) >= 2 and pd.api.types.is_numeric_dtype(df[df.columns[1]]):
+        # Keep the largest values; ranked queries already come back in this order
+        chart = df.nlargest(MAX_CHART_BARS, df.columns[1])
+        st.caption(title if len(df) <= MAX_CHART_BARS else f"{title} (top {MAX_CHART_BARS})")
+        st.bar_chart(chart, x=df.columns[0], y=df.columns[1], sort=False)
+
+        st.markdown("---")
+
 # -------------------------------
 # Streamlit App UI
 # -------------------------------
 st.title("🥑 Local Food Wastage Management System")
 
 
-providers_count = len(providers_df)
-receivers_count = len(receivers_df)
-total_donations = food_listings_df["Quantity"].sum()
+# Headline numbers are aggregated in SQL, not over the pandas frames
+providers_count, receivers_count, total_donations = cached_query(
+    """SELECT (SELECT COUNT(*) FROM providers) AS providers_count,
+              (SELECT COUNT(*) FROM receivers) AS receivers_count,
+              (SELECT COALESCE(SUM(Quantity), 0) FROM food_listings) AS total_donations;"""
+).iloc[0]
 
 
 col1, col2, col3 = st.columns(3)
@@ -189,157 +351,177 @@ col3.metric("Total Donations", total_donations)
 
 
 
-query_choice = st.selectbox("Select a Query to View Results", list(queries.keys()))
-
-if query_choice:
-    if query_choice == "4. Contact info of food providers in a specific city":
-        city_input = st.text_input("Enter city name:")
-        if city_input:
-            df = pd.read_sql(queries[query_choice], conn, params=(city_input,))
-            st.dataframe(df.style.set_properties(**{'background-color': '#8dd3fb', 'color': 'black'}))
-
-    else:
-        df = pd.read_sql(queries[query_choice], conn)
-        st.dataframe(df.style.set_properties(**{'background-color': "#8dd3fb", 'color': 'black'}))
-
+# Fragments rerun on their own, so using one panel doesn't redraw the rest
+@st.fragment
+def query_panel():
+    query_choice = st.selectbox(
+        "Select a Query to View Results",
+        list(queries.keys()) + [ALL_QUERIES]
+    )
 
-    # Show chart if possible
-    if 'df' in locals() and len(df.columns) >= 2 and pd.api.types.is_numeric_dtype(df[df.columns[1]]):
-        fig = px.bar(df, x=df.columns[0], y=df.columns[1], title=query_choice)
-        st.plotly_chart(fig)
-        
-        st.markdown("---")
+    if query_choice == ALL_QUERIES:
+        # Lazy tabs: only the selected tab's query runs on each rerun
+        batch = {name: sql for name, sql in queries.items() if name != CITY_QUERY}
+        tabs = st.tabs(list(batch.keys()), key="all_queries_tabs", on_change="rerun")
+        for tab, (name, sql) in zip(tabs, batch.items()):
+            if tab.open:
+                with tab:
+                    show_df_and_chart(cached_query(sql), name)
+
+    elif query_choice:
+        if query_choice == CITY_QUERY:
+            city_input = st.text_input("Enter city name:")
+            if city_input:
+                df = cached_query(queries[query_choice], (city_input.strip(),))
+                show_df_and_chart(df, query_choice)
+
+        else:
+            df = cached_query(queries[query_choice])
+            show_df_and_chart(df, query_choice)
+
+
+query_panel()
+
+
+# The CRUD panel is a fragment, so rerun the whole app after a write to
+# refresh the metrics, filter lists and donations table drawn outside it
+def write_and_refresh(sql, params, message):
+    execute_write(sql, params)
+    st.session_state["crud_message"] = message
+    st.rerun(scope="app")
+
+
+@st.fragment
+def crud_panel():
+    st.subheader("CRUD Operations")
+    if "crud_message" in st.session_state:
+        st.success(st.session_state.pop("crud_message"))
+
+    # Add Provider
+    with st.expander("➕ Add Provider"):
+        with st.form("add_provider_form"):
+            name = st.text_input("Name")
+            ptype = st.text_input("Type")
+            address = st.text_input("Address")
+            city = st.text_input("City")
+            contact = st.text_input("Contact")
+            submitted = st.form_submit_button("Add")
+            if submitted:
+                write_and_refresh(INSERT_PROVIDER, (name, ptype, address, city, contact),
+                                  "Provider Added Successfully!")
+
+    # Delete Provider
+    with st.expander("🗑 Delete Provider"):
+        prov_id = st.number_input("Provider ID to Delete", min_value=1)
+        if st.button("Delete Provider"):
+            write_and_refresh(DELETE_PROVIDER, (prov_id,), "Provider Deleted Successfully!")
+
+    # Update Provider
+    with st.expander("✏ Update Provider Contact"):
+        prov_id_u = st.number_input("Provider ID to Update", min_value=1)
+        new_contact = st.text_input("New Contact")
+        if st.button("Update Contact"):
+            write_and_refresh(UPDATE_PROVIDER_CONTACT, (new_contact, prov_id_u),
+                              "Contact Updated Successfully!")
+
+
+crud_panel()
 
-st.subheader("CRUD Operations")
-
-# Add Provider
-with st.expander("➕ Add Provider"):
-    with st.form("add_provider_form"):
-        name = st.text_input("Name")
-        ptype = st.text_input("Type")
-        address = st.text_input("Address")
-        city = st.text_input("City")
-        contact = st.text_input("Contact")
-        submitted = st.form_submit_button("Add")
-        if submitted:
-            conn.execute("INSERT INTO providers (Name, Type, Address, City, Contact) VALUES (?, ?, ?, ?, ?)",
-                         (name, ptype, address, city, contact))
-            conn.commit()
-            st.success("Provider Added Successfully!")
-
-# Delete Provider
-with st.expander("🗑 Delete Provider"):
-    prov_id = st.number_input("Provider ID to Delete", min_value=1)
-    if st.button("Delete Provider"):
-        conn.execute("DELETE FROM providers WHERE Provider_ID = ?", (prov_id,))
-        conn.commit()
-        st.success("Provider Deleted Successfully!")
-
-# Update Provider
-with st.expander("✏ Update Provider Contact"):
-    prov_id_u = st.number_input("Provider ID to Update", min_value=1)
-    new_contact = st.text_input("New Contact")
-    if st.button("Update Contact"):
-        conn.execute("UPDATE providers SET Contact = ? WHERE Provider_ID = ?", (new_contact, prov_id_u))
-        conn.commit()
-        st.success("Contact Updated Successfully!")
-        
 
 # Sidebar filters
 st.sidebar.header("Filters")
 
 city_filter = st.sidebar.selectbox(
     "Select City", 
-    ["All"] + sorted(providers_df["City"].dropna().unique())
+    ["All"] + distinct_values("providers", "City")
 )
 
 provider_filter = st.sidebar.selectbox(
     "Select Provider", 
-    ["All"] + sorted(providers_df["Name"].dropna().unique())
+    ["All"] + distinct_values("providers", "Name")
 )
 
 food_type_filter = st.sidebar.selectbox(
     "Select Food Type", 
-    ["All"] + sorted(food_listings_df["Food_Type"].dropna().unique())
+    ["All"] + distinct_values("food_listings", "Food_Type")
 )
 
 meal_type_filter = st.sidebar.selectbox(
     "Select Meal Type", 
-    ["All"] + sorted(food_listings_df["Meal_Type"].dropna().unique())
+    ["All"] + distinct_values("food_listings", "Meal_Type")
 )
 
 
 
-# Apply filters
-filtered_providers = providers_df.copy()
-filtered_food_listings = food_listings_df.copy()
+# Apply filters in SQL, before the join
+where, params = [], []
+for column, value in (("p.City", city_filter), ("p.Name", provider_filter),
+                      ("f.Food_Type", food_type_filter), ("f.Meal_Type", meal_type_filter)):
+    if value != "All":
+        where.append(f"{column} = ?")
+        params.append(value)
 
-if city_filter != "All":
-    filtered_providers = filtered_providers[filtered_providers["City"] == city_filter]
-
-if provider_filter != "All":
-    filtered_providers = filtered_providers[filtered_providers["Name"] == provider_filter]
-
-if food_type_filter != "All":
-    filtered_food_listings = filtered_food_listings[filtered_food_listings["Food_Type"] == food_type_filter]
-
-if meal_type_filter != "All":
-    filtered_food_listings = filtered_food_listings[filtered_food_listings["Meal_Type"] == meal_type_filter]
-
-# Merge for combined view
-filtered_data = pd.merge(
-    filtered_food_listings,
-    filtered_providers,
-    on="Provider_ID",
-    how="inner"
-)
+filtered_from = f"""FROM food_listings f
+        JOIN providers p
+        ON f.Provider_ID = p.Provider_ID
+        {"WHERE " + " AND ".join(where) if where else ""}"""
+total_rows = cached_query(f"SELECT COUNT(*) AS total {filtered_from};", tuple(params)).iat[0, 0]
 
 st.markdown("---")
 
-# Show filtered results
+# Show filtered results one page at a time
 st.subheader("Filtered Food Donations")
+page_count = max(1, -(-total_rows // PAGE_SIZE))
+page = st.number_input("Page", min_value=1, max_value=page_count, step=1)
+
+filtered_data = cached_query(
+    f"""SELECT f.*, p.Name, p.Type, p.Address, p.City, p.Contact
+        {filtered_from}
+        ORDER BY f.Food_ID
+        LIMIT ? OFFSET ?;""",
+    (*params, PAGE_SIZE, (page - 1) * PAGE_SIZE)
+)
+st.caption(f"{total_rows} donations, page {page} of {page_count}")
 st.dataframe(filtered_data)
 
 st.markdown("---")
 
 # Contact provider and receiver section
-st.subheader("📞 Contact Providers or Receivers")
+@st.fragment
+def contact_panel():
+    st.subheader("📞 Contact Providers or Receivers")
 
-contact_type = st.radio(
-    "Who do you want to contact?",
-    ("Provider", "Receiver")
-)
+    contact_type = st.radio(
+        "Who do you want to contact?",
+        ("Provider", "Receiver")
+    )
 
 
-if contact_type == "Provider":
-    selected_provider = st.selectbox(
-        "Select a Provider",
-        providers_df["Name"].unique()
-    )
-    if selected_provider:
-        provider_phone = providers_df.loc[
-            providers_df["Name"] == selected_provider, "Contact"
-        ].values[0]
-        st.markdown(
-            f"[📞 Call {selected_provider}](tel:{provider_phone})",
-            unsafe_allow_html=True
+    if contact_type == "Provider":
+        provider_contacts = contact_map("providers")
+        selected_provider = st.selectbox(
+            "Select a Provider",
+            list(provider_contacts)
         )
-
-elif contact_type == "Receiver":
-    selected_receiver = st.selectbox(
-        "Select a Receiver",
-        receivers_df["Name"].unique()
-    )
-    if selected_receiver:
-        receiver_phone = receivers_df.loc[
-            receivers_df["Name"] == selected_receiver, "Contact"
-        ].values[0]
-        st.markdown(
-            f"[📞 Call {selected_receiver}](tel:{receiver_phone})",
-            unsafe_allow_html=True
+        if selected_provider:
+            provider_phone = provider_contacts[selected_provider]
+            st.markdown(
+                f"[📞 Call {selected_provider}](tel:{provider_phone})",
+                unsafe_allow_html=True
+            )
+
+    elif contact_type == "Receiver":
+        receiver_contacts = contact_map("receivers")
+        selected_receiver = st.selectbox(
+            "Select a Receiver",
+            list(receiver_contacts)
         )
+        if selected_receiver:
+            receiver_phone = receiver_contacts[selected_receiver]
+            st.markdown(
+                f"[📞 Call {selected_receiver}](tel:{receiver_phone})",
+                unsafe_allow_html=True
+            )
 
 
-
-
-
+contact_panel()